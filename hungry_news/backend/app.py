@@ -1,7 +1,10 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 import pymysql
 import pymysql.cursors
 import os
+import threading
+import time
+from collections import deque
 from flask_cors import CORS
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
@@ -176,6 +179,174 @@ def search_news():
     return jsonify(results)
 
 
+# News stream state, shared by every /news-stream client in this process.
+# A single poller thread reads the news_events change log written by the
+# Lambda function, so idle clients never touch the database themselves.
+NEWS_EVENTS_TABLE = "news_events"
+NEWS_STREAM_POLL_SECONDS = int(os.getenv("NEWS_STREAM_POLL_SECONDS", 15))
+NEWS_STREAM_KEEPALIVE_SECONDS = 25
+NEWS_STREAM_BUFFER_SIZE = 200
+NEWS_STREAM_CATCH_UP_LIMIT = 500
+
+news_stream_condition = threading.Condition()
+news_stream_buffer = deque(maxlen=NEWS_STREAM_BUFFER_SIZE)  # recent events, oldest first
+news_stream_state = {
+    "last_event_id": 0,  # newest event seen by the poller
+    "buffer_floor": 0,   # the buffer holds every event after this id
+    "poller": None,
+}
+news_stream_poller_lock = threading.Lock()
+
+
+def load_news_events(after_event_id=None, limit=NEWS_STREAM_BUFFER_SIZE):
+    """
+    Fetch change log rows after the given event id, oldest first.
+    With no event id, fetch the most recent rows instead.
+    """
+    config = {
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'host': os.getenv('DB_HOST'),
+        'database': os.getenv('DB_NAME'),
+        'cursorclass': pymysql.cursors.DictCursor
+    }
+
+    columns = "event_id, table_name, news_id, title, url, datetime, source, impact_level"
+    conn = pymysql.connect(**config)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SHOW TABLES LIKE '{NEWS_EVENTS_TABLE}';")
+            if not cursor.fetchone():
+                return []
+
+            if after_event_id is None:
+                cursor.execute(
+                    f"SELECT {columns} FROM `{NEWS_EVENTS_TABLE}` ORDER BY event_id DESC LIMIT %s", (limit,)
+                )
+                return list(reversed(cursor.fetchall()))
+
+            cursor.execute(
+                f"SELECT {columns} FROM `{NEWS_EVENTS_TABLE}` WHERE event_id > %s ORDER BY event_id LIMIT %s",
+                (after_event_id, limit)
+            )
+            return list(cursor.fetchall())
+    finally:
+        conn.close()
+
+
+def refresh_news_stream(initial=False):
+    """Pull new change log rows into the shared buffer and wake waiting clients."""
+    if initial:
+        events = load_news_events()
+    else:
+        events = load_news_events(news_stream_state["last_event_id"])
+
+    with news_stream_condition:
+        if initial and len(events) < NEWS_STREAM_BUFFER_SIZE:
+            news_stream_state["buffer_floor"] = 0
+        for event in events:
+            news_stream_buffer.append(event)
+            news_stream_state["last_event_id"] = event["event_id"]
+        if len(news_stream_buffer) == NEWS_STREAM_BUFFER_SIZE:
+            news_stream_state["buffer_floor"] = news_stream_buffer[0]["event_id"] - 1
+        if events:
+            news_stream_condition.notify_all()
+
+
+def poll_news_events():
+    """Refresh the shared buffer every poll interval for the lifetime of the process."""
+    while True:
+        time.sleep(NEWS_STREAM_POLL_SECONDS)
+        try:
+            refresh_news_stream()
+        except Exception as e:
+            # keep polling: if this thread died, every stream client would silently stop receiving news
+            print(f"News stream poll failed: {e!r}")
+
+
+def start_news_stream_poller():
+    """Prime the buffer and start the poller thread once per process, restarting it if it has died."""
+    with news_stream_poller_lock:
+        poller = news_stream_state["poller"]
+        if poller is not None and poller.is_alive():
+            return
+        refresh_news_stream(initial=poller is None)
+        poller = threading.Thread(target=poll_news_events, name="news-stream-poller", daemon=True)
+        poller.start()
+        news_stream_state["poller"] = poller
+
+
+def get_news_events_since(event_id):
+    """Events after event_id, from the buffer when it reaches back far enough."""
+    with news_stream_condition:
+        if event_id >= news_stream_state["buffer_floor"]:
+            return [event for event in news_stream_buffer if event["event_id"] > event_id]
+    # the client is further behind than the buffer, so catch up from the database
+    return load_news_events(event_id, limit=NEWS_STREAM_CATCH_UP_LIMIT)
+
+
+def format_news_event(event):
+    """Render a change log row as an SSE message, using the event id as the cursor."""
+    news = {key: value for key, value in event.items() if key != "event_id"}
+    return f"id: {event['event_id']}\nevent: news\ndata: {app.json.dumps(news)}\n\n"
+
+
+@app.route('/news-stream')
+def news_stream():
+    """
+    Server-sent events stream of newly inserted high-impact news.
+    Reconnecting clients send Last-Event-ID (or ?cursor=) to receive what they missed.
+    """
+    cursor = request.headers.get('Last-Event-ID') or request.args.get('cursor')
+    if cursor is not None:
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+        if cursor < 0:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    try:
+        start_news_stream_poller()
+        if cursor is None:
+            # new clients only receive news inserted from now on
+            last_seen = news_stream_state["last_event_id"]
+            missed = []
+        else:
+            last_seen = cursor
+            missed = get_news_events_since(last_seen)
+    except pymysql.MySQLError as e:
+        return jsonify({"error": f"Database error: {str(e)}"}), 500
+
+    def generate(last_seen, missed):
+        # Every block carries an id, so a client that saw no news still
+        # reconnects with a cursor and catches up on what it missed
+        yield f"id: {last_seen}\nretry: {NEWS_STREAM_POLL_SECONDS * 1000}\n\n"
+        while True:
+            for event in missed:
+                yield format_news_event(event)
+                last_seen = event["event_id"]
+
+            with news_stream_condition:
+                news_stream_condition.wait_for(
+                    lambda: news_stream_state["last_event_id"] > last_seen,
+                    timeout=NEWS_STREAM_KEEPALIVE_SECONDS
+                )
+            try:
+                missed = get_news_events_since(last_seen)
+            except pymysql.MySQLError as e:
+                print(f"News stream catch-up failed: {e}")
+                missed = []
+            if not missed:
+                # comment line keeps proxies from closing an idle connection
+                yield f"id: {last_seen}\n: keep-alive\n\n"
+
+    return Response(generate(last_seen, missed), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
 @app.route('/proxy')
 def proxy():
     """
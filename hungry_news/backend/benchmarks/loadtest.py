@@ -0,0 +1,232 @@
+"""
+HTTP load test and latency profile for the Flask API in app.py.
+
+Seeds a local SQLite stand-in (local_db.py) with weekly news tables, serves
+app.py from a threaded Werkzeug server in this process with pymysql.connect
+pointed at the stand-in, and drives each route with concurrent clients.
+Reports p50/p95/p99 latency, throughput and database queries per request,
+then shows how /search-news latency grows with the number of weekly tables.
+
+Clients and server share one interpreter, so treat the numbers as relative:
+compare them across commits on the same machine rather than against production.
+
+Usage:
+    cd hungry_news/backend
+    python benchmarks/loadtest.py --weeks 12 --items-per-week 200 --concurrency 1,8,32
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import requests
+from pytz import timezone
+from werkzeug.serving import make_server
+
+benchmarks_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(benchmarks_dir.parent))
+import app as backend  # noqa: E402
+from local_db import LocalDatabase  # noqa: E402
+
+sources = ["cna_singapore", "cna_asia", "cna_world", "bbc"]
+vocabulary = (
+    "singapore malaysia china japan korea india indonesia philippines thailand vietnam us uk europe "
+    "ukraine russia israel gaza syria iran election president minister parliament court police army "
+    "earthquake typhoon flood fire crash strike protest ceasefire talks summit trade tariff inflation "
+    "rates market stocks oil bank economy budget tax housing transport airport port hospital vaccine "
+    "outbreak climate storm record deal law ban probe charged killed injured rescued warns announces "
+    "raises cuts launches signs rejects approves suspends resigns"
+).split()
+routes = ["major-news", "past-news", "curated-news", "search-news"]
+
+def create_week_table(cursor, table_name):
+    """Same schema as create_table in lambda_function.py."""
+    cursor.execute(f"""
+    CREATE TABLE `{table_name}` (
+        news_id INT AUTO_INCREMENT PRIMARY KEY,
+        title VARCHAR(255),
+        impact_level TINYINT,
+        url VARCHAR(255),
+        source VARCHAR(50),
+        datetime DATETIME
+    )
+    """)
+
+def seed_database(database, weeks, items_per_week, seed):
+    """Create `weeks` weekly tables ending with the current week; return their names, newest first."""
+    rng = random.Random(seed)
+    now = datetime.now(tz=timezone("Asia/Singapore"))
+    table_names = []
+    conn = database.connect()
+    try:
+        with conn.cursor() as cursor:
+            for week in range(weeks):
+                day = now - timedelta(weeks=week)
+                with contextlib.redirect_stdout(io.StringIO()):  # get_week_table_name prints a debug line
+                    table_name = backend.get_week_table_name(day)
+                start_of_week = (day - timedelta(days=day.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+                create_week_table(cursor, table_name)
+                rows = []
+                for index in range(items_per_week):
+                    title = " ".join(rng.sample(vocabulary, rng.randint(6, 12))).capitalize()
+                    published = start_of_week + timedelta(seconds=rng.uniform(0, 7 * 24 * 3600))
+                    rows.append((
+                        title,
+                        3 if rng.random() < 0.3 else 2,
+                        f"https://example.com/{table_name}/{index}",
+                        rng.choice(sources),
+                        published,
+                    ))
+                cursor.executemany(
+                    f"INSERT INTO `{table_name}` (title, impact_level, url, source, datetime) VALUES (%s, %s, %s, %s, %s)",
+                    rows
+                )
+                table_names.append(table_name)
+        conn.commit()
+    finally:
+        conn.close()
+    return table_names
+
+def route_paths(route, table_names, rng, count=64):
+    """Request paths for a route, cycling through tables and search terms."""
+    if route == "major-news":
+        return ["/major-news"]
+    if route in ("past-news", "curated-news"):
+        return [f"/{route}?table_name={table_name}" for table_name in table_names]
+    return [f"/search-news?query={rng.choice(vocabulary)}" for _ in range(count)]
+
+@contextlib.contextmanager
+def serve(database):
+    """Run app.py on a local port with its database calls going to the stand-in."""
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    # Silence the routes' debug prints without hiding this script's own output
+    with mock.patch.object(backend.pymysql, "connect", database.connect), \
+            mock.patch.object(backend, "print", lambda *args, **kwargs: None, create=True):
+        server = make_server("127.0.0.1", 0, backend.app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_port}"
+        finally:
+            server.shutdown()
+            thread.join()
+
+def drive(base_url, paths, total_requests, concurrency):
+    """Send total_requests GETs over `concurrency` threads; return latencies and error count."""
+    local = threading.local()
+
+    def send(index):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        started = time.perf_counter()
+        response = session.get(base_url + paths[index % len(paths)], timeout=60)
+        return time.perf_counter() - started, response.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(send, range(total_requests)))
+        elapsed = time.perf_counter() - started
+    latencies = [latency for latency, _ in results]
+    errors = sum(1 for _, status in results if status != 200)
+    return latencies, errors, elapsed
+
+def profile(database, base_url, paths, total_requests, concurrency, warmup):
+    """Latency percentiles, throughput and DB work per request for one route and concurrency."""
+    drive(base_url, paths, warmup, concurrency)
+    database.reset_stats()
+    latencies, errors, elapsed = drive(base_url, paths, total_requests, concurrency)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "errors": errors,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "throughput_rps": total_requests / elapsed,
+        "queries_per_request": database.queries / total_requests,
+        "connections_per_request": database.connections / total_requests,
+    }
+
+def print_row(label, result):
+    print(f"{label:<22} {result['concurrency']:>5} {result['p50_ms']:9.1f} {result['p95_ms']:9.1f} "
+          f"{result['p99_ms']:9.1f} {result['throughput_rps']:9.1f} {result['queries_per_request']:8.1f} "
+          f"{result['errors']:>6}")
+
+def print_header(label):
+    print(f"{label:<22} {'conc':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>9} {'q/req':>8} {'errors':>6}")
+
+def parse_int_list(value):
+    return [int(part) for part in value.split(",") if part.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weeks", type=int, default=12, help="weekly tables to seed, ending with the current week")
+    parser.add_argument("--items-per-week", type=int, default=200, help="news rows per weekly table")
+    parser.add_argument("--concurrency", type=parse_int_list, default=[1, 8, 32],
+                        help="comma-separated client thread counts")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed requests before each measurement")
+    parser.add_argument("--routes", default=",".join(routes), help="comma-separated routes to drive")
+    parser.add_argument("--search-scaling", type=parse_int_list, default=[1, 2, 4, 8, 12],
+                        help="weekly table counts for the /search-news scaling curve (empty to skip)")
+    parser.add_argument("--search-concurrency", type=int, default=8, help="client threads for the scaling curve")
+    parser.add_argument("--seed", type=int, default=42, help="seed for generated titles and search terms")
+    parser.add_argument("--json", help="write the full report to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report = {
+        "settings": {key: value for key, value in vars(args).items() if key != "json"},
+        "routes": {},
+        "search_scaling": [],
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database = LocalDatabase(os.path.join(temp_dir, "news.sqlite"))
+        table_names = seed_database(database, args.weeks, args.items_per_week, args.seed)
+        print(f"Seeded {args.weeks} weeks x {args.items_per_week} items, {args.requests} requests per measurement\n")
+
+        print_header("route")
+        with serve(database) as base_url:
+            for route in args.routes.split(","):
+                paths = route_paths(route, table_names, rng)
+                report["routes"][route] = []
+                for concurrency in args.concurrency:
+                    result = profile(database, base_url, paths, args.requests, concurrency, args.warmup)
+                    report["routes"][route].append(result)
+                    print_row(f"/{route}", result)
+
+        if args.search_scaling:
+            print(f"\n/search-news scaling with retained weekly tables ({args.items_per_week} items each)")
+            print_header("weekly tables")
+            paths = route_paths("search-news", [], rng)
+            for weeks in args.search_scaling:
+                database = LocalDatabase(os.path.join(temp_dir, f"scaling-{weeks}.sqlite"))
+                seed_database(database, weeks, args.items_per_week, args.seed)
+                with serve(database) as base_url:
+                    result = profile(database, base_url, paths, args.requests, args.search_concurrency, args.warmup)
+                result["weeks"] = weeks
+                report["search_scaling"].append(result)
+                print_row(str(weeks), result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+if __name__ == "__main__":
+    main()
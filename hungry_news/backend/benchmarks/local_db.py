@@ -0,0 +1,92 @@
+"""
+SQLite stand-in for the MySQL database used by app.py.
+
+Implements the part of the PyMySQL API the routes touch (DictCursor rows,
+cursor context managers, SHOW TABLES) and counts every query, so load tests
+can report database queries per request without a MySQL server.
+"""
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+sqlite3.register_adapter(datetime, lambda value: value.replace(tzinfo=None).isoformat(sep=" "))
+sqlite3.register_converter("DATETIME", lambda value: datetime.fromisoformat(value.decode()))
+
+show_tables_like = re.compile(r"^\s*SHOW TABLES LIKE '([^']*)';?\s*$", re.IGNORECASE)
+show_tables = re.compile(r"^\s*SHOW TABLES;?\s*$", re.IGNORECASE)
+
+def translate(sql, params):
+    """Rewrite a MySQL statement from app.py into SQLite."""
+    match = show_tables_like.match(sql)
+    if match:
+        return "SELECT name AS Tables_in_local FROM sqlite_master WHERE type = 'table' AND name LIKE ?", (match.group(1),)
+    if show_tables.match(sql):
+        return ("SELECT name AS Tables_in_local FROM sqlite_master "
+                "WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"), ()
+    sql = sql.replace("INT AUTO_INCREMENT PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+    return sql.replace("%s", "?"), params or ()
+
+class LocalDatabase:
+    """A database file plus query counters shared by every connection to it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.connections = 0
+            self.queries = 0
+
+    def connect(self, **config):
+        """Drop-in replacement for pymysql.connect with a DictCursor."""
+        with self.lock:
+            self.connections += 1
+        return LocalConnection(self, sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES))
+
+    def count_query(self):
+        with self.lock:
+            self.queries += 1
+
+class LocalConnection:
+    def __init__(self, database, conn):
+        self.database = database
+        self.conn = conn
+        self.conn.row_factory = sqlite3.Row
+
+    def cursor(self):
+        return LocalCursor(self.database, self.conn.cursor())
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+class LocalCursor:
+    def __init__(self, database, cursor):
+        self.database = database
+        self.cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cursor.close()
+
+    def execute(self, sql, params=None):
+        self.database.count_query()
+        self.cursor.execute(*translate(sql, params))
+
+    def executemany(self, sql, rows):
+        self.database.count_query()
+        self.cursor.executemany(translate(sql, None)[0], rows)
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [dict(row) for row in self.cursor.fetchall()]
@@ -0,0 +1,18 @@
+# Gunicorn settings, picked up automatically when started from this folder:
+#   gunicorn app:app
+#
+# /news-stream holds each client's connection open indefinitely. With the
+# default sync worker one stream would occupy the whole worker (blocking every
+# other route) and be killed at the worker timeout. gevent workers serve each
+# connection on a greenlet instead, so an idle stream costs a socket and a few
+# KB of memory, and long-lived requests are not subject to the timeout.
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# Open connections per worker, streams and normal requests combined
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 2000))
+
+timeout = 60
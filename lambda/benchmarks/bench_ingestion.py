@@ -0,0 +1,313 @@
+"""
+End-to-end replay benchmark for lambda_handler.
+
+Replays the saved feed XML in benchmarks/fixtures (optionally scaled up with
+synthetic items) through the real lambda_handler, with the feeds served from
+file:// URLs, MySQL replaced by the SQLite stand-in in local_db.py and the
+model loaded from a local joblib file instead of S3.
+
+Each run ingests the feeds twice: "cold" into an empty database, then "warm"
+again into the populated one, which is what the hourly schedule mostly sees.
+Wall time, per-stage time, DB round trips and peak memory are reported and
+appended to benchmarks/results/ingestion.jsonl for comparison across commits.
+
+Usage:
+    cd lambda
+    python benchmarks/bench_ingestion.py --items-per-feed 250 --runs 3 --compare
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+from xml.sax.saxutils import escape
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+benchmarks_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(benchmarks_dir.parent))
+import lambda_function  # noqa: E402
+from local_db import LocalDatabase  # noqa: E402
+
+fixtures_dir = benchmarks_dir / "fixtures"
+default_results_path = benchmarks_dir / "results" / "ingestion.jsonl"
+
+# Functions in lambda_function.py timed as stages, grouped for the report
+stages = {
+    "fetch_rss": "fetch",
+    "get_publish_date": "publish_date",
+    "is_similar": "similarity",
+    "table_exists": "db",
+    "create_table": "db",
+    "create_news_events_table": "db",
+    "delete_old_tables": "db",
+    "delete_old_news_events": "db",
+    "get_existing_titles_and_sources": "db",
+    "insert_news": "db",
+    "insert_news_event": "db",
+}
+
+def load_fixture_items():
+    """Read the recorded feeds with the Lambda's own reader."""
+    feeds = {}
+    for path in sorted(fixtures_dir.glob("*.xml")):
+        feeds[path.stem] = list(lambda_function.iter_rss_items(str(path)))
+    return feeds
+
+def format_pub_date(publish_date, source_name):
+    """Format a pubDate the way each source does: BBC in GMT, CNA in Singapore time."""
+    if source_name == "bbc":
+        return publish_date.astimezone(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    return publish_date.astimezone(timezone(timedelta(hours=8))).strftime("%a, %d %b %Y %H:%M:%S +0800")
+
+def build_feed_xml(source_name, items, items_per_feed, weeks, rng, vocabulary):
+    """
+    Write an RSS document for one source. Recorded items come first, then
+    synthetic ones whose titles are drawn from the recorded vocabulary, so the
+    similarity check sees realistic but mostly distinct headlines. Publish
+    dates are spread over the last `weeks` weeks so no table is treated as old.
+    """
+    count = max(items_per_feed, len(items))
+    now = datetime.now(timezone.utc)
+    entries = []
+    for index in range(count):
+        base = items[index % len(items)]
+        if index < len(items):
+            title = base.title
+        else:
+            title = " ".join(rng.sample(vocabulary, len(base.title.split()))).capitalize()
+        link = base.link if index < len(items) else f"{base.link}-{index}"
+        publish_date = now - timedelta(seconds=rng.uniform(0, weeks * 7 * 24 * 3600))
+        entries.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<description>{escape(base.summary or '')}</description>"
+            f"<link>{escape(link)}</link>"
+            f"<pubDate>{format_pub_date(publish_date, source_name)}</pubDate>"
+            f"<guid isPermaLink=\"false\">{escape(link)}</guid>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n<rss version="2.0"><channel>'
+        f"<title>{escape(source_name)}</title>{''.join(entries)}</channel></rss>\n"
+    )
+
+def write_feeds(work_dir, items_per_feed, weeks, seed):
+    """Write the replay feeds and return rss_urls pointing at them."""
+    rng = random.Random(seed)
+    fixtures = load_fixture_items()
+    vocabulary = sorted({word for items in fixtures.values() for item in items for word in item.title.split()})
+    rss_urls = {}
+    for source_name, items in fixtures.items():
+        path = work_dir / f"{source_name}.xml"
+        path.write_text(build_feed_xml(source_name, items, items_per_feed, weeks, rng, vocabulary), encoding="utf-8")
+        rss_urls[source_name] = path.as_uri()
+    return rss_urls
+
+def train_stand_in_model(path):
+    """Train a small model of the same shape as model.py's pipeline on the fixture titles."""
+    titles = [item.title for items in load_fixture_items().values() for item in items]
+    labels = [index % 4 for index in range(len(titles))]
+    pipeline = Pipeline([
+        ("vectorizer", TfidfVectorizer(max_features=10000, ngram_range=(1, 2))),
+        ("classifier", MultinomialNB(alpha=0.5))
+    ])
+    pipeline.fit(titles, labels)
+    joblib.dump(pipeline, path)
+
+class StageTimer:
+    """Accumulates time spent inside wrapped functions by stage, and calls by function."""
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.calls = Counter()
+
+    def wrap(self, name, stage, func):
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.seconds[stage] += time.perf_counter() - started
+                self.calls[name] += 1
+        return timed
+
+def run_ingestion(database, rss_urls, model_path):
+    """Run lambda_handler once against the local stand-ins and collect its metrics."""
+    timer = StageTimer()
+    real_load = joblib.load
+
+    def load_model(path):
+        model = real_load(path)
+        model.predict = timer.wrap("predict", "predict", model.predict)
+        return model
+
+    database.reset_stats()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(lambda_function, "rss_urls", rss_urls))
+        stack.enter_context(mock.patch.object(lambda_function, "local_model_path", str(model_path)))
+        stack.enter_context(mock.patch.object(lambda_function.mysql.connector, "connect", database.connect))
+        stack.enter_context(mock.patch.object(lambda_function.joblib, "load", timer.wrap("load", "model_load", load_model)))
+        for name, stage in stages.items():
+            stack.enter_context(mock.patch.object(lambda_function, name, timer.wrap(name, stage, getattr(lambda_function, name))))
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+
+        started = time.perf_counter()
+        response = lambda_function.lambda_handler(None, None)
+        wall_seconds = time.perf_counter() - started
+
+    if response["statusCode"] != 200:
+        raise SystemExit(f"lambda_handler failed: {response['body']}")
+    stage_seconds = dict(timer.seconds)
+    stage_seconds["other"] = wall_seconds - sum(timer.seconds.values())
+    return {
+        "wall_seconds": wall_seconds,
+        "stage_seconds": stage_seconds,
+        "items_inserted": timer.calls["insert_news"],
+        "items_dated": timer.calls["get_publish_date"],
+        "db_round_trips": sum(database.round_trips.values()),
+        "db_round_trips_by_kind": dict(database.round_trips),
+        "db_seconds": database.db_seconds,
+    }
+
+def measure_peak_memory(work_dir, rss_urls, model_path):
+    """Peak Python heap during a cold ingestion, measured in a separate untimed run."""
+    database = LocalDatabase(str(work_dir / "memory.sqlite"))
+    tracemalloc.start()
+    try:
+        run_ingestion(database, rss_urls, model_path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def summarise(runs):
+    """Median of each metric across runs; round-trip counts are deterministic."""
+    stage_names = sorted({stage for run in runs for stage in run["stage_seconds"]})
+    return {
+        "wall_seconds": statistics.median(run["wall_seconds"] for run in runs),
+        "stage_seconds": {
+            stage: statistics.median(run["stage_seconds"].get(stage, 0.0) for run in runs) for stage in stage_names
+        },
+        "items_dated": runs[0]["items_dated"],
+        "items_inserted": runs[0]["items_inserted"],
+        "db_round_trips": runs[0]["db_round_trips"],
+        "db_round_trips_by_kind": runs[0]["db_round_trips_by_kind"],
+        "db_seconds": statistics.median(run["db_seconds"] for run in runs),
+    }
+
+def git_revision():
+    """Current commit, marked dirty when the working tree has changes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True, cwd=benchmarks_dir).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, check=True, cwd=benchmarks_dir).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+def print_phase(label, summary):
+    print(f"\n{label}: {summary['wall_seconds']:.3f}s wall, "
+          f"{summary['items_dated'] / summary['wall_seconds']:,.0f} items/s, "
+          f"{summary['items_inserted']} inserts, {summary['db_round_trips']} DB round trips "
+          f"({summary['db_seconds']:.3f}s)")
+    for stage, seconds in sorted(summary["stage_seconds"].items(), key=lambda pair: -pair[1]):
+        print(f"  {stage:<14} {seconds:8.3f}s  {seconds / summary['wall_seconds'] * 100:5.1f}%")
+    kinds = ", ".join(f"{kind} {count}" for kind, count in sorted(summary["db_round_trips_by_kind"].items()))
+    print(f"  round trips: {kinds}")
+
+def compare_with_previous(record, results_path):
+    """Print the change against the latest stored result for the same scenario."""
+    previous = None
+    if results_path.exists():
+        for line in results_path.read_text(encoding="utf-8").splitlines():
+            stored = json.loads(line)
+            if stored["scenario"] == record["scenario"]:
+                previous = stored
+    if previous is None:
+        print("\nNo previous result for this scenario.")
+        return
+    print(f"\nCompared with {previous['revision']} ({previous['recorded_at']}):")
+    for phase in ("cold", "warm"):
+        before = previous[phase]["wall_seconds"]
+        after = record[phase]["wall_seconds"]
+        print(f"  {phase:<5} {before:8.3f}s -> {after:8.3f}s  ({(after - before) / before * 100:+.1f}%)  "
+              f"round trips {previous[phase]['db_round_trips']} -> {record[phase]['db_round_trips']}")
+    before = previous["peak_memory_bytes"]
+    after = record["peak_memory_bytes"]
+    print(f"  peak memory {before / 1024 / 1024:.1f} MiB -> {after / 1024 / 1024:.1f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items-per-feed", type=int, default=0,
+                        help="scale each feed up to this many items (default: recorded items only)")
+    parser.add_argument("--weeks", type=int, default=1, help="spread publish dates over this many weeks")
+    parser.add_argument("--runs", type=int, default=3, help="cold/warm run pairs to take the median of")
+    parser.add_argument("--seed", type=int, default=42, help="seed for synthetic titles and dates")
+    parser.add_argument("--model", help="joblib model to use (default: train a stand-in on the fixtures)")
+    parser.add_argument("--results", default=str(default_results_path), help="JSON lines file to append results to")
+    parser.add_argument("--no-save", action="store_true", help="do not store this result")
+    parser.add_argument("--compare", action="store_true", help="compare with the last stored result for this scenario")
+    args = parser.parse_args()
+
+    results_path = Path(args.results)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        rss_urls = write_feeds(work_dir, args.items_per_feed, args.weeks, args.seed)
+        model_path = Path(args.model) if args.model else work_dir / "trained_model.joblib"
+        if not args.model:
+            train_stand_in_model(model_path)
+
+        cold_runs, warm_runs = [], []
+        for run in range(args.runs):
+            database = LocalDatabase(str(work_dir / f"run{run}.sqlite"))
+            cold_runs.append(run_ingestion(database, rss_urls, model_path))
+            warm_runs.append(run_ingestion(database, rss_urls, model_path))
+        peak_memory = measure_peak_memory(work_dir, rss_urls, model_path)
+
+    record = {
+        "revision": git_revision(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "scenario": {
+            "feeds": sorted(rss_urls),
+            "items_per_feed": args.items_per_feed,
+            "weeks": args.weeks,
+            "seed": args.seed,
+            "model": os.path.basename(args.model) if args.model else "stand-in",
+        },
+        "runs": args.runs,
+        "cold": summarise(cold_runs),
+        "warm": summarise(warm_runs),
+        "peak_memory_bytes": peak_memory,
+    }
+
+    print(f"Revision {record['revision']}, {len(rss_urls)} feeds, "
+          f"{record['cold']['items_dated']} dated items per ingestion, median of {args.runs} runs")
+    print_phase("Cold (empty database)", record["cold"])
+    print_phase("Warm (same feeds again)", record["warm"])
+    print(f"\nPeak memory (cold, tracemalloc): {peak_memory / 1024 / 1024:.1f} MiB")
+
+    if args.compare:
+        compare_with_previous(record, results_path)
+    if not args.no_save:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with results_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\nResult appended to {results_path}")
+
+if __name__ == "__main__":
+    main()
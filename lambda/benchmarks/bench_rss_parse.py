@@ -0,0 +1,85 @@
+"""
+Parse-throughput benchmark for the RSS readers used by the Lambda function.
+
+Compares feedparser against the incremental reader in lambda_function.py on the
+saved feed XML in benchmarks/fixtures, including the publish date parsing done
+per item during ingestion.
+
+Usage:
+    cd lambda
+    python benchmarks/bench_rss_parse.py --rounds 200
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from datetime import datetime
+
+import feedparser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lambda_function import iter_rss_items  # noqa: E402
+
+fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def load_fixtures():
+    """Read every saved feed into memory so disk I/O is not timed."""
+    fixtures = {}
+    for file_name in sorted(os.listdir(fixtures_dir)):
+        if file_name.endswith(".xml"):
+            with open(os.path.join(fixtures_dir, file_name), "rb") as f:
+                fixtures[file_name[:-4]] = f.read()
+    return fixtures
+
+def parse_with_feedparser(xml_bytes):
+    """Parse the way the Lambda did before: feedparser plus strptime per entry."""
+    items = []
+    for entry in feedparser.parse(xml_bytes).entries:
+        publish_date_str = entry.published.replace("GMT", "+0000")
+        publish_date = datetime.strptime(publish_date_str, "%a, %d %b %Y %H:%M:%S %z")
+        items.append((entry.title, entry.link, publish_date))
+    return items
+
+def parse_with_iterparse(xml_bytes):
+    """Parse with the incremental reader; timestamps come pre-parsed."""
+    return [(item.title, item.link, item.published_utc) for item in iter_rss_items(io.BytesIO(xml_bytes))]
+
+def bench(parse, fixtures, rounds):
+    """Return (seconds, items parsed) for `rounds` passes over every fixture."""
+    item_count = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for xml_bytes in fixtures.values():
+            item_count += len(parse(xml_bytes))
+    return time.perf_counter() - start, item_count
+
+def check_agreement(fixtures):
+    """Both readers must produce the same titles, links and instants."""
+    for name, xml_bytes in fixtures.items():
+        expected = parse_with_feedparser(xml_bytes)
+        actual = parse_with_iterparse(xml_bytes)
+        if expected != actual:
+            raise SystemExit(f"Readers disagree on fixture {name}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=100, help="passes over the fixture set per reader")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    check_agreement(fixtures)
+    total_bytes = sum(len(xml_bytes) for xml_bytes in fixtures.values())
+    print(f"{len(fixtures)} fixtures, {total_bytes / 1024:.1f} KiB, {args.rounds} rounds")
+
+    results = {}
+    for label, parse in (("feedparser", parse_with_feedparser), ("iterparse", parse_with_iterparse)):
+        elapsed, item_count = bench(parse, fixtures, args.rounds)
+        results[label] = elapsed
+        print(f"{label:<12} {elapsed:8.3f}s  {item_count / elapsed:12,.0f} items/s  "
+              f"{total_bytes * args.rounds / elapsed / 1024 / 1024:8.2f} MiB/s")
+
+    print(f"Speed-up: {results['feedparser'] / results['iterparse']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+SQLite stand-in for the MySQL database used by lambda_function.py.
+
+Implements the part of the mysql.connector API the Lambda function touches,
+rewrites its MySQL-only statements for SQLite and counts every round trip.
+"""
+import re
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+
+# mysql.connector stores the wall-clock time of aware datetimes, so drop the zone the same way
+sqlite3.register_adapter(datetime, lambda value: value.replace(tzinfo=None).isoformat(sep=" "))
+
+show_tables_like = re.compile(r"^\s*SHOW TABLES LIKE '([^']*)';?\s*$", re.IGNORECASE)
+show_tables = re.compile(r"^\s*SHOW TABLES;?\s*$", re.IGNORECASE)
+
+def translate(sql):
+    """Rewrite a MySQL statement from lambda_function.py into SQLite."""
+    match = show_tables_like.match(sql)
+    if match:
+        return "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?", (match.group(1),)
+    if show_tables.match(sql):
+        return "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'", ()
+    sql = sql.replace("INT AUTO_INCREMENT PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+    return sql.replace("%s", "?"), None
+
+class LocalDatabase:
+    """A database file plus round-trip statistics shared by every connection to it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.round_trips = Counter()
+        self.db_seconds = 0.0
+
+    def connect(self, **config):
+        """Drop-in replacement for mysql.connector.connect."""
+        self.round_trips["CONNECT"] += 1
+        return LocalConnection(self, sqlite3.connect(self.path))
+
+    def record(self, kind, started):
+        self.round_trips[kind] += 1
+        self.db_seconds += time.perf_counter() - started
+
+class LocalConnection:
+    def __init__(self, database, conn):
+        self.database = database
+        self.conn = conn
+
+    def cursor(self):
+        return LocalCursor(self.database, self.conn.cursor())
+
+    def commit(self):
+        started = time.perf_counter()
+        self.conn.commit()
+        self.database.record("COMMIT", started)
+
+    def close(self):
+        self.conn.close()
+
+class LocalCursor:
+    def __init__(self, database, cursor):
+        self.database = database
+        self.cursor = cursor
+        self.rows = []
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    def execute(self, sql, params=()):
+        started = time.perf_counter()
+        statement, translated_params = translate(sql)
+        self.cursor.execute(statement, translated_params if translated_params is not None else params)
+        # Fetch eagerly so the whole round trip is timed here, like a buffered MySQL cursor
+        self.rows = self.cursor.fetchall()
+        self.database.record(sql.split(None, 1)[0].upper(), started)
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self):
+        self.cursor.close()
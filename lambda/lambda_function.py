@@ -7,6 +7,9 @@ import boto3
 import os
 import joblib
 from fuzzywuzzy import fuzz
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from urllib.request import Request, urlopen
 
 # RSS URLs
 rss_urls = {
@@ -16,19 +19,135 @@ rss_urls = {
     "bbc": "https://feeds.bbci.co.uk/news/rss.xml?edition=int",
 }
 
+# Change log read by the backend's /news-stream endpoint
+news_events_table = "news_events"
+
 # S3 Configuration
 model_s3_path = "newsmodel/trained_model.joblib"
 local_model_path = "/tmp/trained_model.joblib"
 
+# NOTE: The Lambda image only copies lambda_function.py (see Dockerfile), so the
+# RSS reader (RssItem, RssFeed, parse_pub_date, iter_rss_items, fetch_rss and
+# their constants) is kept in sync by hand with machine_learning/app/rss_fetcher.py.
+# Apply any fix to both copies.
+
+# RSS reader configuration
+rss_timeout = 15
+rss_user_agent = "Mozilla/5.0 (compatible; HungryNews/1.0)"
+rss_item_fields = ("title", "link", "description", "pubDate", "guid")
+month_numbers = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+class RssItem:
+    """Lightweight RSS entry holding only the fields the ingestion job reads."""
+    __slots__ = ("title", "link", "summary", "published", "guid", "published_utc")
+
+    def __init__(self, title, link, summary, published, guid, published_utc):
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = published
+        self.guid = guid
+        self.published_utc = published_utc
+
+    def __contains__(self, key):
+        # Supports the `'summary' in item` checks written against feedparser entries
+        return getattr(self, key, None) is not None
+
+    def __repr__(self):
+        return f"RssItem(title={self.title!r}, link={self.link!r}, published={self.published!r})"
+
+class RssFeed:
+    """Parsed feed exposing `.entries` like feedparser's result."""
+    __slots__ = ("entries",)
+
+    def __init__(self, entries):
+        self.entries = entries
+
 # Helper Functions
+def parse_pub_date(value):
+    """Parse an RSS pubDate such as 'Fri, 27 Dec 2024 10:00:00 +0800' into a UTC datetime."""
+    try:
+        parts = value.split()
+        if len(parts) == 6:
+            parts = parts[1:]  # drop the weekday
+        day, month, year, clock, zone = parts
+        hour, minute, second = clock.split(":")
+        if zone in ("GMT", "UTC", "Z"):
+            offset = 0
+        else:
+            sign = -1 if zone[0] == "-" else 1
+            offset = sign * (int(zone[1:3]) * 60 + int(zone[3:5]))
+        publish_date = datetime(int(year), month_numbers[month[:3]], int(day),
+                                int(hour), int(minute), int(second), tzinfo=pytz.utc)
+        return publish_date - timedelta(minutes=offset)
+    except (ValueError, KeyError, IndexError):
+        # Unusual formats (named zones, missing seconds) go through the stdlib parser
+        try:
+            publish_date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if publish_date.tzinfo is None:
+            publish_date = publish_date.replace(tzinfo=pytz.utc)
+        return publish_date.astimezone(pytz.utc)
+
+def iter_rss_items(source):
+    """
+    Incrementally parse an RSS 2.0 document from a file path or file object,
+    yielding one RssItem per <item> and discarding each element once read.
+    """
+    fields = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "item":
+                fields = {}
+            continue
+        if elem.tag == "item":
+            published = fields.get("pubDate")
+            yield RssItem(
+                title=fields.get("title", ""),
+                link=fields.get("link"),
+                summary=fields.get("description"),
+                published=published,
+                guid=fields.get("guid"),
+                published_utc=parse_pub_date(published) if published else None,
+            )
+            fields = None
+            elem.clear()
+        elif fields is not None and elem.tag in rss_item_fields:
+            fields[elem.tag] = "".join(elem.itertext()).strip()
+
 def fetch_rss(url):
-    """Fetch and parse RSS feed from a given URL."""
+    """Fetch and parse RSS feed from a given URL, falling back to feedparser."""
+    try:
+        request = Request(url, headers={"User-Agent": rss_user_agent})
+        with urlopen(request, timeout=rss_timeout) as response:
+            entries = list(iter_rss_items(response))
+        if entries:
+            return RssFeed(entries)
+        print(f"No RSS items read from {url}, falling back to feedparser.")
+    except Exception as e:
+        # feedparser is the safety net for anything the fast path cannot read,
+        # including truncated responses (http.client.IncompleteRead) and bad status lines
+        print(f"Fast RSS parse failed for {url}, falling back to feedparser: {e}")
     return feedparser.parse(url)
 
 def get_news_items(rss_data, limit=None):
     """Extract news items from the parsed RSS data."""
     return rss_data.entries[:limit]
 
+def get_publish_date(item, tz_singapore):
+    """Return the item's publish date in Singapore time, or None if it has none."""
+    published_utc = getattr(item, "published_utc", None)
+    if published_utc is not None:
+        return published_utc.astimezone(tz_singapore)
+    if not getattr(item, "published", None):
+        return None
+    publish_date_str = item.published.replace("GMT", "+0000")
+    return datetime.strptime(publish_date_str, "%a, %d %b %Y %H:%M:%S %z").astimezone(tz_singapore)
+
 def download_model_from_s3():
     """Download the trained model from S3."""
     s3 = boto3.client("s3")
@@ -93,8 +212,11 @@ def lambda_handler(event, context):
         if not table_exists(cursor, current_week_table):
             create_table(cursor, current_week_table)
             print(f"Current week table {current_week_table} created.")
+        if not table_exists(cursor, news_events_table):
+            create_news_events_table(cursor)
         # Delete old tables
         delete_old_tables(cursor)
+        delete_old_news_events(cursor)
 
         # Fetch and process RSS feeds
         high_impact_titles = []  # To store titles of high-impact news
@@ -110,18 +232,12 @@ def lambda_handler(event, context):
                     if "/videos/" in item.link:
                         # print(f"Skipping video feed: {item.title} - {item.link}")
                         continue
-                    # Parse publish date
-                    if hasattr(item, "published"):
-                        publish_date_str = item.published.replace("GMT", "+0000")
-                        publish_date = datetime.strptime(publish_date_str, "%a, %d %b %Y %H:%M:%S %z")
-                    else:
+                    # Parse publish date (already in UTC for the fast reader)
+                    publish_date = get_publish_date(item, tz_singapore)
+                    if publish_date is None:
                         print(f"Skipping item without published date: {item}")
                         continue
 
-                    # Adjust timezone if necessary
-                    if source_name == "bbc":
-                        publish_date = publish_date.astimezone(tz_singapore)
-
                     # Determine the table name
                     table_name = get_table_name(publish_date.date())
 
@@ -151,7 +267,11 @@ def lambda_handler(event, context):
 
                     # Insert the news into the table
                     news_item = (title, impact_level, item.link, source_name, publish_date)
-                    insert_news(cursor, table_name, news_item)
+                    news_id = insert_news(cursor, table_name, news_item)
+
+                    # Signal connected clients about new high-impact news
+                    if impact_level == 3:
+                        insert_news_event(cursor, table_name, news_id, news_item)
 
                 except Exception as e:
                     print(f"Error processing item: {item}, error: {e}")
@@ -244,5 +364,42 @@ def insert_news(cursor, table_name, news_item):
     VALUES (%s, %s, %s, %s, %s)
     """
     cursor.execute(insert_query, news_item)
+    return cursor.lastrowid
+
+def create_news_events_table(cursor):
+    """Create the change log of inserted high-impact news."""
+    create_table_sql = f"""
+    CREATE TABLE `{news_events_table}` (
+        event_id INT AUTO_INCREMENT PRIMARY KEY,
+        table_name VARCHAR(20),
+        news_id INT,
+        title VARCHAR(255),
+        impact_level TINYINT,
+        url VARCHAR(255),
+        source VARCHAR(50),
+        datetime DATETIME,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+    try:
+        cursor.execute(create_table_sql)
+        print(f"Table created: {news_events_table}")
+    except mysql.connector.Error as err:
+        print(f"Failed creating table: {err}")
+        raise
+
+def insert_news_event(cursor, table_name, news_id, news_item):
+    """Record an inserted news item in the change log."""
+    insert_query = f"""
+    INSERT INTO `{news_events_table}` (table_name, news_id, title, impact_level, url, source, datetime)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+    cursor.execute(insert_query, (table_name, news_id) + tuple(news_item))
+
+def delete_old_news_events(cursor):
+    """Delete change log rows older than the three months of news we keep."""
+    three_months_ago = datetime.now() - timedelta(days=90)
+    cursor.execute(f"DELETE FROM `{news_events_table}` WHERE created_at < %s", (three_months_ago,))
+
 if __name__ == "__main__":
     lambda_handler(None, None)
@@ -1,7 +1,112 @@
 import feedparser
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.request import Request, urlopen
+
+# NOTE: The Lambda image only copies lambda_function.py (see Dockerfile), so the
+# RSS reader (RssItem, RssFeed, parse_pub_date, iter_rss_items, fetch_rss and
+# their constants) is kept in sync by hand with lambda/lambda_function.py.
+# Apply any fix to both copies.
+rss_timeout = 15
+rss_user_agent = "Mozilla/5.0 (compatible; HungryNews/1.0)"
+rss_item_fields = ("title", "link", "description", "pubDate", "guid")
+month_numbers = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+class RssItem:
+    """Lightweight RSS entry holding only the fields we read."""
+    __slots__ = ("title", "link", "summary", "published", "guid", "published_utc")
+
+    def __init__(self, title, link, summary, published, guid, published_utc):
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = published
+        self.guid = guid
+        self.published_utc = published_utc
+
+    def __contains__(self, key):
+        # Supports the `'summary' in item` checks written against feedparser entries
+        return getattr(self, key, None) is not None
+
+    def __repr__(self):
+        return f"RssItem(title={self.title!r}, link={self.link!r}, published={self.published!r})"
+
+class RssFeed:
+    """Parsed feed exposing `.entries` like feedparser's result."""
+    __slots__ = ("entries",)
+
+    def __init__(self, entries):
+        self.entries = entries
+
+def parse_pub_date(value):
+    """Parse an RSS pubDate such as 'Fri, 27 Dec 2024 10:00:00 +0800' into a UTC datetime."""
+    try:
+        parts = value.split()
+        if len(parts) == 6:
+            parts = parts[1:]  # drop the weekday
+        day, month, year, clock, zone = parts
+        hour, minute, second = clock.split(":")
+        if zone in ("GMT", "UTC", "Z"):
+            offset = 0
+        else:
+            sign = -1 if zone[0] == "-" else 1
+            offset = sign * (int(zone[1:3]) * 60 + int(zone[3:5]))
+        published = datetime(int(year), month_numbers[month[:3]], int(day),
+                             int(hour), int(minute), int(second), tzinfo=timezone.utc)
+        return published - timedelta(minutes=offset)
+    except (ValueError, KeyError, IndexError):
+        # Unusual formats (named zones, missing seconds) go through the stdlib parser
+        try:
+            published = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        return published.astimezone(timezone.utc)
+
+def iter_rss_items(source):
+    """
+    Incrementally parse an RSS 2.0 document from a file path or file object,
+    yielding one RssItem per <item> and discarding each element once read.
+    """
+    fields = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "item":
+                fields = {}
+            continue
+        if elem.tag == "item":
+            published = fields.get("pubDate")
+            yield RssItem(
+                title=fields.get("title", ""),
+                link=fields.get("link"),
+                summary=fields.get("description"),
+                published=published,
+                guid=fields.get("guid"),
+                published_utc=parse_pub_date(published) if published else None,
+            )
+            fields = None
+            elem.clear()
+        elif fields is not None and elem.tag in rss_item_fields:
+            fields[elem.tag] = "".join(elem.itertext()).strip()
 
 def fetch_rss(url):
-    """Fetch and parse RSS feed from a given URL."""
+    """Fetch and parse RSS feed from a given URL, falling back to feedparser."""
+    try:
+        request = Request(url, headers={"User-Agent": rss_user_agent})
+        with urlopen(request, timeout=rss_timeout) as response:
+            entries = list(iter_rss_items(response))
+        if entries:
+            return RssFeed(entries)
+        print(f"No RSS items read from {url}, falling back to feedparser.")
+    except Exception as e:
+        # feedparser is the safety net for anything the fast path cannot read,
+        # including truncated responses (http.client.IncompleteRead) and bad status lines
+        print(f"Fast RSS parse failed for {url}, falling back to feedparser: {e}")
     return feedparser.parse(url)
 
 def get_news_items(rss_data):